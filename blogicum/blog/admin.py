@@ -1,8 +1,12 @@
 from django.contrib import admin
+from django.forms.models import BaseInlineFormSet
 
 from .models import Category, Comment, Location, Post
 
 
+POSTS_INLINE_LIMIT = 50
+
+
 class PostAdmin(admin.ModelAdmin):
     list_display = (
         'title',
@@ -20,12 +24,37 @@ class PostAdmin(admin.ModelAdmin):
     search_fields = ('title',)
     list_filter = ('category',)
     list_display_links = ('title',)
+    list_select_related = ('author', 'category', 'location')
     empty_value_display = 'Не задано'
 
 
-class PostInLine(admin.StackedInline):
+class RecentPostsFormSet(BaseInlineFormSet):
+    """Набор форм, ограниченный последними POSTS_INLINE_LIMIT постами"""
+
+    def get_queryset(self):
+        if not hasattr(self, '_recent_queryset'):
+            self._recent_queryset = (
+                super().get_queryset()[:POSTS_INLINE_LIMIT]
+            )
+        return self._recent_queryset
+
+
+class PostInLine(admin.TabularInline):
     model = Post
-    extra = 1
+    formset = RecentPostsFormSet
+    extra = 0
+    can_delete = False
+    fields = ('title', 'pub_date', 'is_published')
+    readonly_fields = fields
+    show_change_link = True
+
+    def has_add_permission(self, request, obj=None):
+        return False
+
+    def get_queryset(self, request):
+        return super().get_queryset(request).only(
+            'title', 'pub_date', 'is_published', 'category', 'location'
+        ).order_by('-pub_date')
 
 
 class CategoryAdmin(admin.ModelAdmin):
@@ -66,6 +95,7 @@ class CommentAdmin(admin.ModelAdmin):
     search_fields = (
         'post',
     )
+    list_select_related = ('author', 'post')
 
 
 admin.site.register(Comment, CommentAdmin)
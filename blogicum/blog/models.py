@@ -83,6 +83,11 @@ class Post(BaseModel):
         verbose_name = 'публикация'
         verbose_name_plural = 'Публикации'
         ordering = ('-pub_date',)
+        indexes = (
+            models.Index(fields=('-pub_date', 'is_published')),
+            models.Index(fields=('author', '-pub_date')),
+            models.Index(fields=('category', '-pub_date')),
+        )
 
     def get_absolute_url(self):
         return reverse('blog:post_detail', kwargs={"pk": self.pk})
@@ -114,6 +119,9 @@ class Comment(models.Model):
     class Meta:
         verbose_name = 'комментарий'
         verbose_name_plural = 'Комментарии'
+        indexes = (
+            models.Index(fields=('post', 'created_at')),
+        )
 
     def __str__(self):
         return self.text[:30]
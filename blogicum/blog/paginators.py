@@ -0,0 +1,136 @@
+from datetime import timezone as dt_timezone
+
+from django.core.paginator import InvalidPage
+from django.db.models import Q
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+from django.utils.functional import cached_property
+
+
+CURSOR_SEPARATOR = '|'
+MAX_PAGES = 100
+MAX_PK = 2 ** 63 - 1
+
+
+class KeysetPage:
+    """Страница курсорной пагинации: без номера и общего числа страниц.
+
+    object_list содержит первичные ключи постов страницы; сами записи
+    догружаются отдельным запросом уже для этих ключей.
+    """
+
+    def __init__(
+        self, object_list, paginator, next_cursor=None, previous_cursor=None
+    ):
+        self.object_list = object_list
+        self.paginator = paginator
+        self.next_cursor = next_cursor
+        self.previous_cursor = previous_cursor
+
+    def __repr__(self):
+        return '<Keyset page>'
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def has_next(self):
+        return self.next_cursor is not None
+
+    def has_previous(self):
+        return self.previous_cursor is not None
+
+    def has_other_pages(self):
+        return self.has_previous() or self.has_next()
+
+
+class KeysetPaginator:
+    """Пагинатор по ключу (pub_date, id) вместо LIMIT/OFFSET.
+
+    Каждая страница выбирается диапазоном по индексу от курсора,
+    поэтому стоимость запроса не зависит от глубины страницы,
+    а COUNT(*) не выполняется. Выборка идёт только по ключам
+    (pub_date, pk), без присоединённых таблиц.
+    """
+
+    def __init__(self, object_list, per_page):
+        self.object_list = object_list
+        self.per_page = int(per_page)
+
+    @cached_property
+    def count(self):
+        """Число постов, ограниченное MAX_PAGES страницами."""
+        return self.object_list.order_by().values('pk')[
+            :self.per_page * MAX_PAGES + 1
+        ].count()
+
+    def encode_cursor(self, key):
+        pub_date, pk = key
+        return f'{pub_date.isoformat()}{CURSOR_SEPARATOR}{pk}'
+
+    def decode_cursor(self, cursor):
+        try:
+            date, pk = cursor.rsplit(CURSOR_SEPARATOR, 1)
+            date, pk = parse_datetime(date), int(pk)
+            if timezone.is_naive(date):
+                date = timezone.make_aware(date)
+            # Значение должно переводиться в UTC, как при записи в БД.
+            date.astimezone(dt_timezone.utc)
+        except (AttributeError, OverflowError, TypeError, ValueError):
+            date = None
+        if date is None or not 0 < pk <= MAX_PK:
+            raise InvalidPage('Некорректный курсор страницы')
+        return date, pk
+
+    def newer_than(self, date, pk):
+        return self.object_list.filter(
+            Q(pub_date__gt=date) | Q(pub_date=date, pk__gt=pk)
+        )
+
+    def older_than(self, date, pk):
+        return self.object_list.filter(
+            Q(pub_date__lt=date) | Q(pub_date=date, pk__lt=pk)
+        )
+
+    def page(self, after=None, before=None):
+        if after is not None and before is not None:
+            raise InvalidPage('Укажите только один курсор страницы')
+        if before is not None:
+            date, pk = self.decode_cursor(before)
+            rows = list(self.newer_than(date, pk).order_by(
+                'pub_date', 'pk'
+            ).values_list(
+                'pub_date', 'pk'
+            )[:self.per_page + 1])
+            has_newer = len(rows) > self.per_page
+            rows = rows[:self.per_page][::-1]
+            oldest = rows[-1] if rows else (date, pk)
+            has_older = self.older_than(*oldest).exists()
+            return KeysetPage(
+                [pk for _, pk in rows],
+                self,
+                next_cursor=(
+                    self.encode_cursor(oldest) if has_older else None
+                ),
+                previous_cursor=(
+                    self.encode_cursor(rows[0]) if has_newer else None
+                ),
+            )
+        queryset = self.object_list
+        if after is not None:
+            queryset = self.older_than(*self.decode_cursor(after))
+        rows = list(queryset.order_by('-pub_date', '-pk').values_list(
+            'pub_date', 'pk'
+        )[:self.per_page + 1])
+        has_older = len(rows) > self.per_page
+        rows = rows[:self.per_page]
+        return KeysetPage(
+            [pk for _, pk in rows],
+            self,
+            next_cursor=self.encode_cursor(rows[-1]) if has_older else None,
+            previous_cursor=(
+                self.encode_cursor(rows[0]) if after and rows else None
+            ),
+        )
@@ -2,33 +2,55 @@ from django.contrib.auth import get_user_model
 from django.contrib.auth.views import LoginView
 from django.contrib.auth.mixins import LoginRequiredMixin, UserPassesTestMixin
 from django.contrib.auth.forms import UserCreationForm
+from django.core.paginator import InvalidPage
 from django.shortcuts import get_object_or_404, redirect
+from django.db.models import Count
 from django.views.generic import (
     CreateView, DeleteView, DetailView, ListView, UpdateView
 )
 from django.urls import reverse_lazy, reverse
+from django.utils import timezone
+from django.utils.functional import cached_property
 from django.http import Http404
 
 
 from .models import Post, Category, Comment
 from .forms import PostForm, CommentForms
-
-from datetime import datetime
+from .paginators import KeysetPaginator
 
 POSTS_VALUE = 5
+LIST_POST_FIELDS = (
+    'title',
+    'text',
+    'pub_date',
+    'image',
+    'is_published',
+    'author__username',
+    'category__title',
+    'category__slug',
+    'category__is_published',
+    'location__name',
+    'location__is_published',
+)
 User = get_user_model()
 
 
-def date_now():
-    return datetime.now()
+class CachedGetObjectMixin:
+    """Миксин, запоминающий объект на время обработки запроса"""
+
+    def get_object(self, queryset=None):
+        if queryset is not None:
+            return super().get_object(queryset)
+        if not hasattr(self, '_cached_object'):
+            self._cached_object = super().get_object()
+        return self._cached_object
 
 
-class OnlyAuthorMixin(UserPassesTestMixin):
+class OnlyAuthorMixin(CachedGetObjectMixin, UserPassesTestMixin):
 
     def test_func(self):
         if self.request.user.is_authenticated:
-            object = self.get_object()
-            return object.author == self.request.user
+            return self.get_object().author_id == self.request.user.pk
 
     def handle_no_permission(self):
         return redirect('blog:post_detail', pk=self.kwargs['pk'])
@@ -48,8 +70,29 @@ class OnlyUserMixin(UserPassesTestMixin):
 
 class ListViewMixin:
     model = Post
-    ordering = '-pub_date'
     paginate_by = 10
+    paginator_class = KeysetPaginator
+
+    def paginate_queryset(self, queryset, page_size):
+        paginator = self.paginator_class(queryset, page_size)
+        try:
+            page = paginator.page(
+                after=self.request.GET.get('after') or None,
+                before=self.request.GET.get('before') or None,
+            )
+        except InvalidPage as e:
+            raise Http404(str(e))
+        page.object_list = list(self.get_page_queryset(page.object_list))
+        return (paginator, page, page.object_list, page.has_other_pages())
+
+    def get_page_queryset(self, pks):
+        return Post.objects.filter(pk__in=pks).select_related(
+            'category', 'location', 'author'
+        ).only(
+            *LIST_POST_FIELDS
+        ).annotate(
+            comment_count=Count('comments')
+        ).order_by('-pub_date', '-pk')
 
 
 class PostFormMixin:
@@ -59,15 +102,11 @@ class PostFormMixin:
 
 class CommentMixin:
     model = Comment
+    pk_url_kwarg = 'comment_id'
     template_name = 'blog/comment.html'
 
-    def get_object(self, queryset=None):
-        obj = get_object_or_404(
-            Comment,
-            pk=self.kwargs['comment_id'],
-            post_id=self.kwargs['pk']
-        )
-        return obj
+    def get_queryset(self):
+        return Comment.objects.filter(post_id=self.kwargs['pk'])
 
     def get_success_url(self):
         return reverse('blog:post_detail', kwargs={'pk': self.kwargs['pk']})
@@ -95,14 +134,13 @@ class PostListView(ListViewMixin, ListView):
     """Класс, отображающий главную страницу проекта с постами"""
 
     template_name = 'blog/index.html'
-    queryset = Post.objects.filter(
-        pub_date__lt=date_now(),
-        is_published=True,
-        category__is_published=True,
-    ).select_related(
-        'category',
-        'location',
-        'author').prefetch_related('comments')
+
+    def get_queryset(self):
+        return Post.objects.filter(
+            pub_date__lt=timezone.now(),
+            is_published=True,
+            category__is_published=True,
+        )
 
 
 class CategoryListView(ListViewMixin, ListView):
@@ -110,25 +148,24 @@ class CategoryListView(ListViewMixin, ListView):
 
     template_name = 'blog/category.html'
 
-    def get_context_data(self, **kwargs):
-        category = get_object_or_404(
+    @cached_property
+    def category(self):
+        return get_object_or_404(
             Category, slug=self.kwargs['slug'],
             is_published=True
         )
+
+    def get_context_data(self, **kwargs):
         context = super(CategoryListView, self).get_context_data(**kwargs)
-        context['category'] = category
+        context['category'] = self.category
         return context
 
     def get_queryset(self):
-        slug = self.kwargs['slug']
         return Post.objects.filter(
-            pub_date__lt=date_now(),
+            pub_date__lt=timezone.now(),
             is_published=True,
-            category__slug=slug,
-            category__is_published=True,
-        ).select_related(
-            'category', 'location', 'author'
-        ).prefetch_related('comments')
+            category=self.category,
+        )
 
 
 class PostCreateView(
@@ -149,21 +186,19 @@ class PostDetailView(DetailView):
     model = Post
     template_name = 'blog/detail.html'
 
-    def get_object(self):
-        pk = self.kwargs['pk']
-        post = get_object_or_404(Post, id=pk)
+    def get_object(self, queryset=None):
+        post = super().get_object(queryset)
         if not (post.is_published or post.author == self.request.user):
             raise Http404()
         return post
 
     def get_context_data(self, **kwargs):
         context = super(PostDetailView, self).get_context_data(**kwargs)
-        post = self.get_object()
+        post = self.object
         context['form'] = CommentForms()
-        context['post'] = post
-        context['comments'] = (
-            Comment.objects.filter(post=post).order_by('created_at')
-        ).select_related('author', 'post')
+        context['comments'] = list(
+            post.comments.select_related('author').order_by('created_at')
+        )
         return context
 
 
@@ -178,56 +213,31 @@ class PostDeleteView(OnlyAuthorMixin, SuccessReverse, DeleteView):
 
     model = Post
 
-    def get_object(self):
-        obj = get_object_or_404(
-            Post,
-            pk=self.kwargs['pk']
-        )
-        return obj
-
 
-class ProfileListView(ListView):
+class ProfileListView(ListViewMixin, ListView):
     """Класс, отображающий страницу профиля"""
 
-    model = User
     template_name = 'blog/profile.html'
-    paginate_by = 10
 
-    def get_user(self):
+    @cached_property
+    def profile_user(self):
         return get_object_or_404(User, username=self.kwargs['username'])
 
     def get_context_data(self, **kwargs):
-        user = self.get_user()
+        user = self.profile_user
         context = super(ProfileListView, self).get_context_data(**kwargs)
         context['profile'] = user
         context['post'] = Post.objects.filter(author=user)
         return context
 
     def get_queryset(self):
-        user = self.get_user()
-        if self.request.user.is_authenticated:
-            if self.request.user.username == user.username:
-                return Post.objects.filter(
-                    author=user
-                ).select_related(
-                    'author', 'location', 'category'
-                ).prefetch_related('comments')
-            else:
-                return Post.objects.filter(
-                    author=user,
-                    is_published=True,
-                    category__is_published=True
-                ).select_related(
-                    'author', 'location', 'category'
-                ).prefetch_related('comments')
-        else:
-            return Post.objects.filter(
-                author=user,
+        queryset = Post.objects.filter(author=self.profile_user)
+        if self.request.user != self.profile_user:
+            queryset = queryset.filter(
                 is_published=True,
                 category__is_published=True
-            ).select_related(
-                'author', 'location', 'category'
-            ).prefetch_related('comments')
+            )
+        return queryset
 
 
 class ProfileCreateView(SuccessReverse, CreateView):
@@ -256,23 +266,18 @@ class ProfileUpdateView(OnlyUserMixin, SuccessReverse, UpdateView):
 class CommentCreateView(LoginRequiredMixin, CreateView):
     """Класс, обрабатывающий создание комментария"""
 
-    object = None
     model = Comment
     form_class = CommentForms
 
     def dispatch(self, request, *args, **kwargs):
-        self.object = get_object_or_404(Post, pk=kwargs['pk'])
+        self.post_obj = get_object_or_404(Post, pk=kwargs['pk'])
         return super(
             CommentCreateView, self
         ).dispatch(request, *args, **kwargs)
 
-    def get_object(self):
-        post_id = self.kwargs['pk']
-        return Post.objects.get(id=post_id)
-
     def form_valid(self, form):
         form.instance.author = self.request.user
-        form.instance.post = self.get_object()
+        form.instance.post = self.post_obj
         return super(CommentCreateView, self).form_valid(form)
 
     def get_success_url(self):
@@ -285,27 +290,11 @@ class CommentUpdateView(OnlyAuthorMixin, CommentMixin, UpdateView):
     fields = ['text', ]
 
 
-class CommentDeleteView(OnlyAuthorMixin, DeleteView):
+class CommentDeleteView(OnlyAuthorMixin, CommentMixin, DeleteView):
     """Класс, обрабатывающий удаление комментария"""
 
-    model = Comment
-    template_name = 'blog/comment.html'
-
-    def get_object(self):
-        obj = get_object_or_404(
-            Comment,
-            pk=self.kwargs['comment_id'],
-            post_id=self.kwargs['pk']
-        )
-        return obj
-
     def get_context_data(self, **kwargs):
-        obj = self.get_object()
         context = super().get_context_data(**kwargs)
-        context['comment'] = obj
         if 'form' in context:
             del context['form']
         return context
-
-    def get_success_url(self):
-        return reverse('blog:post_detail', kwargs={'pk': self.kwargs['pk']})
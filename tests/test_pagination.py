@@ -0,0 +1,98 @@
+from datetime import timedelta
+from http import HTTPStatus
+
+import pytest
+from django.urls import reverse
+from django.utils import timezone
+
+from blog.models import Category, Post
+
+POSTS_COUNT = 25
+
+
+@pytest.fixture
+def paired_posts(user):
+    category = Category.objects.create(
+        title="Категория", description="Описание", slug="category"
+    )
+    now = timezone.now()
+    # Посты идут парами с одинаковым pub_date, чтобы курсор
+    # различал их по id.
+    for i in range(POSTS_COUNT):
+        Post.objects.create(
+            title=f"Пост {i}",
+            text="Текст",
+            pub_date=now - timedelta(hours=i // 2 + 1),
+            author=user,
+            category=category,
+        )
+    return list(
+        Post.objects.order_by("-pub_date", "-pk").values_list("pk", flat=True)
+    )
+
+
+def get_page(client, **params):
+    response = client.get(reverse("blog:index"), params)
+    assert response.status_code == HTTPStatus.OK, (
+        "Убедитесь, что главная страница загружается с курсором пагинации."
+    )
+    page = response.context["page_obj"]
+    return page, [post.pk for post in page]
+
+
+@pytest.mark.django_db
+def test_keyset_walk_forward_and_back(client, paired_posts):
+    page, pks = get_page(client)
+    assert not page.has_previous()
+    pages = [pks]
+    while page.has_next():
+        page, pks = get_page(client, after=page.next_cursor)
+        pages.append(pks)
+    assert sum(pages, []) == paired_posts, (
+        "Убедитесь, что страницы, полученные по курсору `after`, идут подряд"
+        " без пропусков и повторов."
+    )
+    assert [len(pks) for pks in pages] == [10, 10, 5]
+
+    for expected_pks in reversed(pages[:-1]):
+        page, pks = get_page(client, before=page.previous_cursor)
+        assert pks == expected_pks, (
+            "Убедитесь, что курсор `before` возвращает предыдущую страницу."
+        )
+    assert not page.has_previous()
+
+
+@pytest.mark.django_db
+def test_keyset_empty_after_is_first_page(client, paired_posts):
+    _, first_pks = get_page(client)
+    _, pks = get_page(client, after="")
+    assert pks == first_pks
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "params",
+    (
+        {"after": "garbage"},
+        {"before": "garbage"},
+        {"after": "2020-01-01T00:00:00|1", "before": "2020-01-01T00:00:00|1"},
+        {"after": "2020-01-01T00:00:00|99999999999999999999999"},
+        {"before": "9999-12-31T23:59:59-05:00|1"},
+    ),
+)
+def test_keyset_invalid_cursor_returns_404(client, paired_posts, params):
+    response = client.get(reverse("blog:index"), params)
+    assert response.status_code == HTTPStatus.NOT_FOUND, (
+        "Убедитесь, что некорректный курсор пагинации приводит к ошибке 404."
+    )
+
+
+@pytest.mark.django_db
+def test_keyset_before_oldest_has_no_older_link(client, paired_posts):
+    page, pks = get_page(client, before="2000-01-01T00:00:00+00:00|1")
+    assert pks == paired_posts[-10:]
+    assert page.has_previous()
+    assert not page.has_next(), (
+        "Убедитесь, что ссылка на более старые публикации не выводится,"
+        " если старее публикаций нет."
+    )